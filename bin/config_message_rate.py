@@ -56,6 +56,11 @@ MESSAGE_RATE_MAP = {
     'default': MessageRate.DEFAULT,
 }
 
+# Name lookup tables used to resolve message ID queries. These are fixed for a given fusion-engine-client version, so
+# build them once at import instead of on every query.
+NMEA_TYPE_BY_NAME = {str(t): t for t in NmeaMessageType}
+FE_OUTPUT_TYPE_BY_NAME = {k: v for k, v in message_type_by_name.items() if not k.endswith('Input')}
+
 
 def _get_diagnostics_config_type(interface: InterfaceID):
     if interface.type == TransportType.SERIAL:
@@ -146,11 +151,9 @@ def _get_message_ids(protocol: ProtocolType, query: str) -> List[int]:
     if query.lower() == 'all' or query == '*':
         message_ids = [ALL_MESSAGES_ID]
     elif protocol == ProtocolType.NMEA:
-        nmea_type_by_name = {str(t): t for t in NmeaMessageType}
-        message_ids = _search_message_ids(nmea_type_by_name, query)
+        message_ids = _search_message_ids(NMEA_TYPE_BY_NAME, query)
     elif protocol == ProtocolType.FUSION_ENGINE:
-        types = {k: v for k, v in message_type_by_name.items() if not k.endswith('Input')}
-        message_ids = _search_message_ids(types, query)
+        message_ids = _search_message_ids(FE_OUTPUT_TYPE_BY_NAME, query)
     else:
         message_ids = [int(s.strip()) for s in query.split(',')]
 
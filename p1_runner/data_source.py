@@ -1,9 +1,9 @@
-import select
+import selectors
 import socket
 import time
 from abc import ABC, abstractmethod
 from socket import SocketType
-from threading import Event, Lock
+from threading import Condition, Lock
 from typing import BinaryIO, Optional, Union
 
 import serial.threaded
@@ -25,6 +25,7 @@ RESPONSE_TIMEOUT = 5
 RX_BYTE_TIMEOUT = 0.1
 MAX_DATA_BUFFER_SIZE = 10 * 1024 * 1024
 DATA_BUFFER_DROP_SIZE = 1 * 1024 * 1024
+FLUSH_READ_SIZE = 64 * 1024
 
 
 class DataSource(ABC):
@@ -44,12 +45,13 @@ class DataSource(ABC):
         pass
 
     @abstractmethod
-    def read(self, size: int, timeout=RESPONSE_TIMEOUT) -> bytes:
+    def read(self, size: int, timeout=RESPONSE_TIMEOUT, return_any=False) -> bytes:
         """!
         @brief Read data from the device.
 
         @param size The maximum amount of data to read.
         @param timeout The max time in seconds this function should take before returning with less than `size` bytes.
+        @param return_any If `True`, return as soon as any data is available, rather than waiting for `size` bytes.
 
         @return The data read. If the read timed out, the length of the returned data will be less than `size`.
         """
@@ -93,7 +95,8 @@ class WebSocketDataSource(DataSource):
     def write(self, data: bytes):
         self.socket_out.send(data)
 
-    def read(self, size: int, timeout=RESPONSE_TIMEOUT) -> bytes:
+    def read(self, size: int, timeout=RESPONSE_TIMEOUT, return_any=False) -> bytes:
+        # Note: Each websocket recv() returns a single complete frame, so this always behaves as if return_any is set.
         try:
             data = self.socket_in.recv(timeout)
         except TimeoutError:
@@ -118,7 +121,7 @@ class WebSocketDataSource(DataSource):
             if len(data) == 0:
                 break
             in_waiting += len(data)
-        logger.debug('Flushing data in buffer. [size=%d B]' % in_waiting)
+        logger.debug('Flushing data in buffer. [size=%d B]', in_waiting)
 
 
 class SocketDataSource(DataSource):
@@ -133,33 +136,45 @@ class SocketDataSource(DataSource):
             rx_log: Optional[Union[LogManager, BinaryIO]] = None):
         self.socket_out = socket_out
         self.socket_in = socket_in if socket_in is not None else socket_out
+        self.selector = None
         if self.socket_in:
             # The socket buffer can be made large enough that we don't need a reader thread.
             self.socket_in.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, MAX_DATA_BUFFER_SIZE)
             self.socket_in.setblocking(False)
+            # Register the socket once up front rather than rebuilding the select() arguments on every read.
+            self.selector = selectors.DefaultSelector()
+            self.selector.register(self.socket_in, selectors.EVENT_READ)
 
         self.rx_log = rx_log
 
     def write(self, data: bytes):
         self.socket_out.sendall(data)
 
-    def read(self, size: int, timeout=RESPONSE_TIMEOUT) -> bytes:
-        data = b''
-        start_time = time.time()
-        remaining = timeout
-        while len(data) < size and remaining >= 0:
-            ready = select.select([self.socket_in], [], [], remaining)
-            if ready[0]:
-                data += self.socket_in.recv(size - len(data))
-            else:
-                break
-            remaining = timeout - (time.time() - start_time)
+    def read(self, size: int, timeout=RESPONSE_TIMEOUT, return_any=False) -> bytes:
+        # Receive directly into a single preallocated buffer instead of concatenating the result of each recv() call.
+        buffer = bytearray(size)
+        with memoryview(buffer) as view:
+            bytes_read = 0
+            start_time = time.monotonic()
+            remaining = timeout
+            while bytes_read < size and remaining >= 0:
+                if self.selector.select(remaining):
+                    bytes_read += self.socket_in.recv_into(view[bytes_read:])
+                    if return_any:
+                        break
+                else:
+                    break
+                remaining = timeout - (time.monotonic() - start_time)
+            data = bytes(view[:bytes_read])
         if self.rx_log:
             self.rx_log.write(data)
         return data
 
     def stop(self):
         self.flush_rx()
+        if self.selector is not None:
+            self.selector.close()
+            self.selector = None
         if self.socket_in is not None:
             self.socket_in.close()
         if self.socket_out is not None and self.socket_out != self.socket_in:
@@ -168,11 +183,11 @@ class SocketDataSource(DataSource):
     def flush_rx(self):
         in_waiting = 0
         while True:
-            data = self.read(1024, 0)
+            data = self.read(FLUSH_READ_SIZE, 0, return_any=True)
             if len(data) == 0:
                 break
             in_waiting += len(data)
-        logger.debug('Flushing data in buffer. [size=%d B]' % in_waiting)
+        logger.debug('Flushing data in buffer. [size=%d B]', in_waiting)
 
 
 class SerialDataSource(DataSource, serial.threaded.Protocol):
@@ -182,56 +197,104 @@ class SerialDataSource(DataSource, serial.threaded.Protocol):
     The main complexity here is that serial ports on Linux only support a 4kB buffer. This means that at high data
     rates, the port must be read constantly to avoid dropping data. This class provides a thread to do that and store
     the data until it's actually needed.
+
+    For low rate or strictly request/response use, the reader thread can be disabled by setting `threaded=False`. In
+    that case, @ref read() reads directly from the serial port, avoiding the cost of handing data between threads.
     """
 
     def __init__(
             self, serial_out: Serial, serial_in: Optional[Serial] = None,
-            rx_log: Optional[Union[LogManager, BinaryIO]] = None):
+            rx_log: Optional[Union[LogManager, BinaryIO]] = None, threaded: bool = True):
         self.serial_out = serial_out
         self.serial_in = serial_in if serial_in is not None else serial_out
         self.rx_log = rx_log
-        self.data_buffer = b''
-        # This event indicates that a byte or more is available in the data_buffer.
-        self.data_event = Event()
-        # This lock synchronizes writes to the data_buffer.
+        self.threaded = threaded
+        if not self.threaded:
+            # Bound each blocking serial read so read() can honor its timeout.
+            self.serial_in.timeout = RX_BYTE_TIMEOUT
+        self.data_buffer = bytearray()
+        # This lock synchronizes access to the data_buffer.
         self.data_lock = Lock()
+        # This condition is notified when a byte or more is added to the data_buffer.
+        self.data_cond = Condition(self.data_lock)
         self.rx_thread = None
 
     def write(self, data: bytes):
-        logger.debug(' '.join('%02x' % b for b in data))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(data.hex(' '))
         self.serial_out.write(data)
 
-    def read(self, size: int, timeout=RESPONSE_TIMEOUT) -> bytes:
+    def read(self, size: int, timeout=RESPONSE_TIMEOUT, return_any=False) -> bytes:
+        if self.threaded:
+            data = self._read_buffered(size, timeout, return_any)
+        else:
+            data = self._read_direct(size, timeout, return_any)
+
+        if self.rx_log:
+            self.rx_log.write(data)
+        return data
+
+    def _read_buffered(self, size: int, timeout: float, return_any: bool) -> bytes:
         if self.rx_thread is None:
             raise RuntimeError('Reading DeviceInterface without calling "start_rx_thread".')
-        data = b''
-        start_time = time.time()
-        while size > 0 and time.time() - start_time < timeout:
-            logger.trace(f'Buffered {len(self.data_buffer)} B.')
-            if not self.data_event.wait(RX_BYTE_TIMEOUT):
-                logger.debug('Timed out waiting for byte to be added to buffer.')
-                continue
-            self.data_lock.acquire()
-
-            if len(self.data_buffer) <= size:
-                data += self.data_buffer
-                size -= len(self.data_buffer)
-                self.data_buffer = b''
-                self.data_event.clear()
+        # Collect the chunks taken from the RX buffer and join them once at the end, so each byte is only copied once on
+        # its way out.
+        chunks = []
+        start_time = time.monotonic()
+        while size > 0:
+            remaining = timeout - (time.monotonic() - start_time)
+            if remaining <= 0:
+                break
+
+            # Take the whole buffer while holding the lock, then do any copying after releasing it so the RX thread is
+            # not blocked while we process the data.
+            with self.data_cond:
+                logger.trace('Buffered %d B.', len(self.data_buffer))
+                if not self.data_cond.wait_for(lambda: len(self.data_buffer) > 0, remaining):
+                    logger.debug('Timed out waiting for data to be added to buffer.')
+                    break
+                pending = self.data_buffer
+                self.data_buffer = bytearray()
+
+            if len(pending) <= size:
+                chunks.append(pending)
+                size -= len(pending)
             else:
-                data += self.data_buffer[:size]
-                self.data_buffer = self.data_buffer[size:]
+                chunks.append(pending[:size])
+                del pending[:size]
                 size = 0
 
-            self.data_lock.release()
-        if self.rx_log:
-            self.rx_log.write(data)
-        return data
+                # Return the unused data to the front of the buffer, ahead of anything received in the meantime.
+                with self.data_cond:
+                    self.data_buffer[:0] = pending
+
+            if return_any:
+                break
+
+        return b''.join(chunks)
+
+    def _read_direct(self, size: int, timeout: float, return_any: bool) -> bytes:
+        data = bytearray()
+        start_time = time.monotonic()
+        while len(data) < size and time.monotonic() - start_time < timeout:
+            # Read everything the OS already has buffered in one call. If nothing is waiting, block for up to
+            # RX_BYTE_TIMEOUT for the next byte.
+            read_size = max(1, min(size - len(data), self.serial_in.in_waiting))
+            data += self.serial_in.read(read_size)
+            if return_any and len(data) > 0 and self.serial_in.in_waiting == 0:
+                break
+
+        return bytes(data)
 
     def start_read_thread(self):
         """!
         @brief This function must be called before any calls to @ref self.read.
+
+        This is not needed, and has no effect, if the data source was created with `threaded=False`.
         """
+        if not self.threaded:
+            return
+
         self.rx_thread = serial.threaded.ReaderThread(self.serial_in, self)
         self.rx_thread.start()
 
@@ -249,23 +312,24 @@ class SerialDataSource(DataSource, serial.threaded.Protocol):
 
     # The callback used in the self.rx_thread when serial data is received.
     def data_received(self, data):
-        logger.trace(f'RX thread got data. [size={len(data)} B]')
+        logger.trace('RX thread got data. [size=%d B]', len(data))
         if len(data) == 0:
             return
 
-        self.data_lock.acquire()
-        self.data_buffer += data
-        if len(data) > MAX_DATA_BUFFER_SIZE:
-            logger.error(
-                'Serial RX buffer full. Dropping oldest data. [buffer_size=%d B, dropping=%d B]', MAX_DATA_BUFFER_SIZE,
-                DATA_BUFFER_DROP_SIZE)
-            self.data_buffer = self.data_buffer[DATA_BUFFER_DROP_SIZE:]
-        self.data_event.set()
-        self.data_lock.release()
+        with self.data_cond:
+            self.data_buffer.extend(data)
+            if len(self.data_buffer) > MAX_DATA_BUFFER_SIZE:
+                logger.error(
+                    'Serial RX buffer full. Dropping oldest data. [buffer_size=%d B, dropping=%d B]',
+                    MAX_DATA_BUFFER_SIZE, DATA_BUFFER_DROP_SIZE)
+                del self.data_buffer[:DATA_BUFFER_DROP_SIZE]
+            self.data_cond.notify()
 
     def flush_rx(self):
-        self.data_lock.acquire()
-        in_waiting = len(self.data_buffer)
-        self.data_lock.release()
-        logger.debug('Flushing data in buffer. [size=%d B]' % in_waiting)
+        if self.threaded:
+            with self.data_lock:
+                in_waiting = len(self.data_buffer)
+        else:
+            in_waiting = self.serial_in.in_waiting
+        logger.debug('Flushing data in buffer. [size=%d B]', in_waiting)
         self.read(in_waiting)
@@ -17,6 +17,9 @@ REBOOT_MAX_TIME = 5
 
 MAX_FE_MSG_SIZE = 16 * 1024
 
+# Encoded `*XX\r\n` NMEA sentence suffix for each possible checksum value.
+_NMEA_CHECKSUM_SUFFIXES = tuple(f'*{i:02X}\r\n'.encode('ascii') for i in range(256))
+
 
 class DeviceInterface:
     '''!
@@ -47,13 +50,13 @@ class DeviceInterface:
         config_set_cmd.interface = interface
         config_set_cmd.config_object = config_object
         message = self.fe_encoder.encode_message(config_set_cmd)
-        logger.debug('Sending config to device. [size=%d B]' % len(message))
+        logger.debug('Sending config to device. [size=%d B]', len(message))
         self.data_source.write(message)
 
     def send_save(self, action: SaveAction = SaveAction.SAVE):
         apply_cmd = SaveConfigMessage(action)
         message = self.fe_encoder.encode_message(apply_cmd)
-        logger.debug('Saving config. [size=%d B]' % len(message))
+        logger.debug('Saving config. [size=%d B]', len(message))
         self.data_source.write(message)
 
     def get_config(self, source: ConfigurationSource, config: Union[ConfigType, InterfaceConfigSubmessage]):
@@ -64,7 +67,7 @@ class DeviceInterface:
             req_cmd.config_type = config
         req_cmd.request_source = source
         message = self.fe_encoder.encode_message(req_cmd)
-        logger.debug('Requesting config. [size=%d B]' % len(message))
+        logger.debug('Requesting config. [size=%d B]', len(message))
         # We flush the serial RX buffer before we send the request in an attempt to avoid the response timing out as we
         # process the backlog of data. This only a concern when running on a lower CPU power system like a Raspi that
         # may not be able to keep up with the byte-by-byte processing for a high data rate interface.
@@ -75,7 +78,7 @@ class DeviceInterface:
         config_object.insert(2, source)
         req_cmd = GetMessageRate(*config_object)
         message = self.fe_encoder.encode_message(req_cmd)
-        logger.debug('Querying message rate. [size=%d B]' % len(message))
+        logger.debug('Querying message rate. [size=%d B]', len(message))
         # We flush the serial RX buffer before we send the request in an attempt to avoid the response timing out as we
         # process the backlog of data. This only a concern when running on a lower CPU power system like a Raspi that
         # may not be able to keep up with the byte-by-byte processing for a high data rate interface.
@@ -93,20 +96,21 @@ class DeviceInterface:
         config_set_cmd = SetMessageRate(*config_object)
         message = self.fe_encoder.encode_message(config_set_cmd)
 
-        logger.debug('Sending message rate config to device. [size=%d B]' % len(message))
+        logger.debug('Sending message rate config to device. [size=%d B]', len(message))
         self.data_source.write(message)
 
     def send_message(self, message: Union[MessagePayload, str]):
         if isinstance(message, MessagePayload):
             encoded_data = self.fe_encoder.encode_message(message)
-            logger.debug('Sending %s message. [size=%d B]' % (repr(message), len(encoded_data)))
+            logger.debug('Sending %r message. [size=%d B]', message, len(encoded_data))
             self.data_source.write(encoded_data)
         else:
             if message[0] != '$':
                 message = '$' + message
-            message += '*%02X' % NMEAFramer._calculate_checksum(message)
-            encoded_data = (message + '\r\n').encode('utf8')
-            logger.debug('Sending NMEA message. [%s (%d B)]' % (message.rstrip(), len(encoded_data)))
+            # Encode once and compute the checksum directly on the encoded bytes.
+            encoded_data = message.encode('utf8')
+            encoded_data += _NMEA_CHECKSUM_SUFFIXES[NMEAFramer._calculate_checksum(encoded_data)]
+            logger.debug('Sending NMEA message. [%s (%d B)]', encoded_data.decode('utf8').rstrip(), len(encoded_data))
             self.data_source.write(encoded_data)
 
     # Note, this will only work properly if the interface has at least one
@@ -114,13 +118,15 @@ class DeviceInterface:
     # could be done a little more simply if it just looked for sequence number
     # resets, but that would require an enabled FE message.
     def wait_for_reboot(self, data_stop_timeout=REBOOT_MAX_START_TIME, data_restart_timeout=REBOOT_MAX_TIME):
-        start_time = time.time()
+        start_time = time.monotonic()
         reboot_started = False
         reboot_finished = False
         self.data_source.flush_rx()
         logger.debug("Waiting for data to stop.")
-        while not reboot_started and time.time() - start_time < data_stop_timeout:
-            data = self.data_source.read(1, REBOOT_MIN_TIME)
+        while not reboot_started and time.monotonic() - start_time < data_stop_timeout:
+            # Drain whatever has arrived in a single call rather than reading one byte per iteration. The read only
+            # returns empty if no data arrived for REBOOT_MIN_TIME.
+            data = self.data_source.read(MAX_FE_MSG_SIZE, REBOOT_MIN_TIME, return_any=True)
             reboot_started = len(data) == 0
         if reboot_started:
             # Since device reset, expect sequence number to reset.
@@ -141,29 +147,37 @@ class DeviceInterface:
         else:
             return self._wait_for_nmea_message(msg_type, response_timeout)
 
+    # Note: The wait functions below read whatever data is available in bulk rather than one byte at a time. Any other
+    # messages decoded from the same chunk of data as the response are discarded. This class is used for one-at-a-time
+    # request/response exchanges, so this is not expected to drop anything of interest.
     def _wait_for_fe_message(self, msg_type, response_timeout):
-        start_time = time.time()
+        start_time = time.monotonic()
         while True:
-            msgs = self.fe_decoder.on_data(self.data_source.read(1))
+            msgs = self.fe_decoder.on_data(self._read_available(start_time, response_timeout))
             for msg in msgs:
                 if msg[0].message_type == msg_type:
-                    logger.debug('Response: %s', str(msg[1]))
-                    logger.debug(' '.join('%02x' % b for b in msg[2]))
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug('Response: %s', str(msg[1]))
+                        logger.debug(msg[2].hex(' '))
                     return msg[1]
-            if time.time() - start_time > response_timeout:
+            if time.monotonic() - start_time > response_timeout:
                 return None
 
     def _wait_for_nmea_message(self, msg_type, response_timeout):
         if msg_type[0] != '$':
             msg_type = '$' + msg_type
 
-        start_time = time.time()
+        start_time = time.monotonic()
         while True:
-            msgs = self.nmea_framer.on_data(self.data_source.read(1))
+            msgs = self.nmea_framer.on_data(self._read_available(start_time, response_timeout))
             for msg in msgs:
                 if msg.startswith(msg_type):
                     msg = msg.rstrip()
                     logger.debug('Response: %s', msg)
                     return msg
-            if time.time() - start_time > response_timeout:
+            if time.monotonic() - start_time > response_timeout:
                 return None
+
+    def _read_available(self, start_time, response_timeout):
+        remaining_sec = max(response_timeout - (time.monotonic() - start_time), 0)
+        return self.data_source.read(MAX_FE_MSG_SIZE, remaining_sec, return_any=True)
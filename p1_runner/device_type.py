@@ -21,10 +21,10 @@ class DeviceType(Enum):
     UBLOX = auto()
 
     def is_lg69t(self) -> bool:
-        return self in (DeviceType.LG69T_AH, DeviceType.LG69T_AM, DeviceType.LG69T_AP)
+        return self in _LG69T_DEVICE_TYPES
 
     def device_uses_unframed_logs(self) -> bool:
-        return self.is_lg69t() or self is DeviceType.LC29H
+        return self in _UNFRAMED_LOG_DEVICE_TYPES
 
     @classmethod
     def from_string(cls, name: Optional[str]) -> 'DeviceType':
@@ -35,3 +35,8 @@ class DeviceType(Enum):
                 pass
 
         return DeviceType.UNKNOWN
+
+
+# Note: These must be defined outside of the enum class body, otherwise they would be treated as enum members.
+_LG69T_DEVICE_TYPES = frozenset((DeviceType.LG69T_AH, DeviceType.LG69T_AM, DeviceType.LG69T_AP))
+_UNFRAMED_LOG_DEVICE_TYPES = _LG69T_DEVICE_TYPES | {DeviceType.LC29H}
@@ -14,7 +14,8 @@ class WebsocketDataType(IntEnum):
 
 class WebsocketHeader(object):
     _FORMAT = '<Id'
-    _SIZE: int = struct.calcsize(_FORMAT)
+    _STRUCT = struct.Struct(_FORMAT)
+    _SIZE: int = _STRUCT.size
 
     def __init__(self):
         self.data_type = WebsocketDataType.DATA_TYPE_NMEA
@@ -22,9 +23,9 @@ class WebsocketHeader(object):
 
     def pack(self, buffer: bytes = None, offset: int = 0, return_buffer: bool = False) -> Union[bytes, int]:
         if buffer is None:
-            buffer = struct.pack(WebsocketHeader._FORMAT, self.data_type, self.timestamp)
+            buffer = WebsocketHeader._STRUCT.pack(self.data_type, self.timestamp)
         else:
-            struct.pack_into(WebsocketHeader._FORMAT, buffer, self.data_type, self.timestamp)
+            WebsocketHeader._STRUCT.pack_into(buffer, offset, self.data_type, self.timestamp)
 
         if return_buffer:
             return buffer
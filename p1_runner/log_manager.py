@@ -11,6 +11,9 @@ from datetime import datetime, timezone
 from . import trace as logging
 from .log_manifest import DeviceType, LogManifest
 
+# Timestamp file entries: (milliseconds since log start, offset into the data file), both rolling over at 2^32.
+_TIMESTAMP_ENTRY = struct.Struct('II')
+
 
 class LogManager(threading.Thread):
     logger = logging.getLogger('point_one.log_manager')
@@ -117,34 +120,39 @@ class LogManager(threading.Thread):
             timestamp_path = os.path.join(self.log_dir, self.data_filename + '.timestamps')
             self.logger.debug("Opening timestamp file '%s'." % timestamp_path)
             timestamp_file = open(timestamp_path, 'wb')
-        with open(path, 'wb') as bin_file:
-            if self.log_created_cmd is not None:
-                try:
-                    subprocess.Popen(self.log_created_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
-                                     shell=True)
-                except Exception as e:
-                    self.logger.warning("Error running log created command: %s" % repr(e))
-
-            while True:
-                data = self.data_queue.get()
-                if data is None:
-                    break
-                else:
-                    size = len(data)
-                    self.logger.trace('Writing %d bytes.' % size)
-                    bin_file.write(data)
-                    timestamp = time.time()
-                    if timestamp_file and timestamp - self.last_timestamp > 0.001:
-                        # This will rollover after about about 50 days.
-                        milliseconds = int(round((timestamp - self.start_time) * 1000.)) % 2**32
-                        # This will rollover after about about 26 hours of full rate 460800 baud data.
-                        offset = bin_file.tell() % 2**32
-                        data = struct.pack('II', milliseconds, offset)
-                        timestamp_file.write(data)
-                        self.last_timestamp = timestamp
-
-        if timestamp_file is not None:
-            timestamp_file.close()
+        # Make sure the timestamp file is flushed and closed even if writing fails part way through the log.
+        try:
+            with open(path, 'wb') as bin_file:
+                if self.log_created_cmd is not None:
+                    try:
+                        subprocess.Popen(self.log_created_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                         shell=True)
+                    except Exception as e:
+                        self.logger.warning("Error running log created command: %s" % repr(e))
+
+                # Track the data file offset ourselves rather than calling bin_file.tell(), which issues an lseek()
+                # system call on every write.
+                bytes_written = 0
+                while True:
+                    data = self.data_queue.get()
+                    if data is None:
+                        break
+                    else:
+                        size = len(data)
+                        self.logger.trace('Writing %d bytes.' % size)
+                        bin_file.write(data)
+                        bytes_written += size
+                        timestamp = time.time()
+                        if timestamp_file and timestamp - self.last_timestamp > 0.001:
+                            # This will rollover after about about 50 days.
+                            milliseconds = int(round((timestamp - self.start_time) * 1000.)) % 2**32
+                            # This will rollover after about about 26 hours of full rate 460800 baud data.
+                            offset = bytes_written % 2**32
+                            timestamp_file.write(_TIMESTAMP_ENTRY.pack(milliseconds, offset))
+                            self.last_timestamp = timestamp
+        finally:
+            if timestamp_file is not None:
+                timestamp_file.close()
 
         self.logger.info("Log data stored in '%s'." % self.log_dir)
 
@@ -1,3 +1,5 @@
+import functools
+import operator
 import re
 from enum import IntEnum
 
@@ -25,10 +27,15 @@ class NMEAFramer(object):
         self.buffer = ''
 
     def on_data(self, data):
-        if isinstance(data, bytes):
-            data = data.decode('latin-1')
+        # Accept any bytes-like object (bytes, bytearray, memoryview) so callers don't need to make a copy first.
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            data = str(data, 'latin-1')
 
-        self.logger.trace('Received %d bytes. [%s]' % (len(data), str(data.encode('latin-1'))))
+        # Note: on_data() is called for every chunk of incoming data, so we only pay the cost of formatting the trace
+        # prints below when trace output is actually enabled.
+        trace_enabled = self.logger.isEnabledFor(logging.TRACE)
+        if trace_enabled:
+            self.logger.trace('Received %d bytes. [%s]' % (len(data), str(data.encode('latin-1'))))
 
         buffer = self.buffer + data
         candidates = buffer.split('\n')
@@ -36,7 +43,7 @@ class NMEAFramer(object):
         candidates = candidates[:-1]
 
         if len(candidates) > 0:
-            self.logger.debug('Processing %d candidate messages.' % len(candidates))
+            self.logger.debug('Processing %d candidate messages.', len(candidates))
 
         messages = []
         for i, candidate in enumerate(candidates):
@@ -48,14 +55,16 @@ class NMEAFramer(object):
             msg_start_offset = self.next_msg_start_offset + start_idx
             self.next_msg_start_offset += len(candidate) + 1
             if start_idx < 0:
-                self.logger.debug('Sync byte not found. Discarding candidate %d. [size=%d B]' % (i, len(candidate)))
-                self.logger.trace(candidate.encode('latin-1'))
+                self.logger.debug('Sync byte not found. Discarding candidate %d. [size=%d B]', i, len(candidate))
+                if trace_enabled:
+                    self.logger.trace(candidate.encode('latin-1'))
                 continue
 
             nmea_string = candidate[start_idx:] + '\n'
             candidate = candidate[start_idx + 1:]
 
-            self.logger.trace('Testing candidate %d: %s' % (i, nmea_string.encode('latin-1')))
+            if trace_enabled:
+                self.logger.trace('Testing candidate %d: %s' % (i, nmea_string.encode('latin-1')))
 
             # Strip off any trailing \r characters. Normally, a NMEA string should end in \r\n (\n already removed by
             # split() above), but we have seen some cases (RTKLIB) where there are multiple consecutive \r characters so
@@ -65,13 +74,13 @@ class NMEAFramer(object):
             # The string must contain a talker ID + message ID (typically 5+ chars, but we'll allow as small as 1 char),
             # plus a checksum (3 chars).
             if len(candidate) < (1 + 3):
-                self.logger.debug('Candidate string too short. Discarding candidate %d. [size=%d B]' %
-                                  (i, len(nmea_string)))
+                self.logger.debug('Candidate string too short. Discarding candidate %d. [size=%d B]',
+                                  i, len(nmea_string))
                 continue
 
             # Now that we've stripped off \r\n, the last 3 characters should be a checksum (*XX).
             if candidate[-3] != '*':
-                self.logger.debug('Checksum not found. Discarding candidate %d. [size=%d B]' % (i, len(nmea_string)))
+                self.logger.debug('Checksum not found. Discarding candidate %d. [size=%d B]', i, len(nmea_string))
                 continue
 
             # Pull out the NMEA message ID for the prints below.
@@ -84,16 +93,16 @@ class NMEAFramer(object):
             try:
                 expected_checksum = int(candidate[-2:], 16)
             except:
-                self.logger.debug('Checksum bytes not valid. Discarding candidate %d. [message=%s, size=%d B]' %
-                                  (i, message_id, len(nmea_string)))
+                self.logger.debug('Checksum bytes not valid. Discarding candidate %d. [message=%s, size=%d B]',
+                                  i, message_id, len(nmea_string))
                 continue
 
             candidate = candidate[:-3]
 
             # Next, if there are any non-ASCII characters in the string, it can't be a NMEA string.
-            if not re.match(self.VALID_NMEA_CONTENTS, candidate):
-                self.logger.debug('Found non-ASCII contents. Discarding candidate %d. [message=%s, size=%d B]' %
-                                  (i, message_id, len(nmea_string)))
+            if not self.VALID_NMEA_CONTENTS.match(candidate):
+                self.logger.debug('Found non-ASCII contents. Discarding candidate %d. [message=%s, size=%d B]',
+                                  i, message_id, len(nmea_string))
                 continue
 
             # Finally, validate the checksum.
@@ -101,8 +110,8 @@ class NMEAFramer(object):
 
             if expected_checksum == calculated_checksum:
                 self.logger.debug(
-                    'Checksum passed. Dispatching message %d. [message=%s, size=%d B, checksum=0x%02X]' %
-                    (i, message_id, len(nmea_string), calculated_checksum))
+                    'Checksum passed. Dispatching message %d. [message=%s, size=%d B, checksum=0x%02X]',
+                    i, message_id, len(nmea_string), calculated_checksum)
 
                 if self.return_offset:
                     nmea_msg = (nmea_string, msg_start_offset)
@@ -113,24 +122,26 @@ class NMEAFramer(object):
                     self.callback(nmea_msg)
             else:
                 self.logger.debug('Checksum mismatch. Discarding candidate %d. [message=%s, size=%d B, '
-                                  'checksum=0x%02X, expected_checksum=0x%02X]' %
-                                  (i, message_id, len(nmea_string), calculated_checksum, expected_checksum))
+                                  'checksum=0x%02X, expected_checksum=0x%02X]',
+                                  i, message_id, len(nmea_string), calculated_checksum, expected_checksum)
 
-        self.logger.debug('%d bytes remaining in the buffer.' % len(self.buffer))
+        self.logger.debug('%d bytes remaining in the buffer.', len(self.buffer))
 
         return messages
 
     @classmethod
     def _calculate_checksum(cls, data, is_stripped=False):
+        # Compute the checksum over the encoded bytes so the XOR can be done by a C-level reduce() instead of a Python
+        # loop. Latin-1 maps each character to the byte with the same value, matching the decoding in on_data().
+        if isinstance(data, str):
+            data = data.encode('latin-1')
+
         if not is_stripped:
-            if data[0] == '$':
+            if data[:1] == b'$':
                 data = data[1:]
 
-            checksum_idx = data.rfind('*')
+            checksum_idx = data.rfind(b'*')
             if checksum_idx >= 0:
                 data = data[:checksum_idx]
 
-        checksum = 0
-        for c in data:
-            checksum ^= ord(c)
-        return checksum
+        return functools.reduce(operator.xor, data, 0)
@@ -223,63 +223,70 @@ class RTCMFramer(object):
             data = data.encode()
         self.buffer += data
 
+        # Track the start of the unprocessed data with an index instead of re-slicing the buffer every time a message
+        # or a byte is consumed, which would copy all of the remaining data each time. The consumed data is dropped
+        # from the buffer once, on return.
+        buffer = self.buffer
+        offset = 0
         while True:
             # Search for the RTCM preamble.
             if not self.preamble_found:
-                try:
-                    idx = self.buffer.index(RTCM3_PREAMBLE)
-                except ValueError:
-                    self.logger.trace('Skipping %d bytes searching for preamble.' % len(self.buffer))
-                    self.total_data_offset += len(self.buffer)
-                    self.buffer = bytes()
+                idx = buffer.find(RTCM3_PREAMBLE, offset)
+                if idx < 0:
+                    self.logger.trace('Skipping %d bytes searching for preamble.', len(buffer) - offset)
+                    self.total_data_offset += len(buffer) - offset
+                    offset = len(buffer)
                     break
 
-                self.total_data_offset += idx
-                self.buffer = self.buffer[idx:]
+                self.total_data_offset += idx - offset
+                offset = idx
 
                 self.logger.trace('Found preamble.')
                 self.preamble_found = True
 
+            available = len(buffer) - offset
+
             # The 2nd byte in the header (1st byte after preamble) contains 6 reserved bits, plus 2 bits of rhe 10b
             # payload length. Those 6 reserved bits should be 0 as of RTCM 10403.3. If they are not, we'll assume the
             # preamble byte we found was not actually an RTCM message.
-            if len(self.buffer) >= RTCM3_HEADER_LENGTH + 2:
-                reserved = self.buffer[1] >> 2
+            if available >= RTCM3_HEADER_LENGTH + 2:
+                reserved = buffer[offset + 1] >> 2
                 if reserved != 0x0:
                     self.logger.debug(
                         'Header reserved bits non-zero. Assuming invalid sync. [reserved=0x%02X]' % reserved)
-                    # Add all but first byte of failed message back onto data buffer to retry parsing.
-                    self.buffer = self.buffer[1:]
+                    # Skip the first byte of the failed message and retry parsing.
+                    offset += 1
                     self.total_data_offset += 1
                     self.preamble_found = False
                     continue
 
-            if len(self.buffer) < RTCM3_HEADER_LENGTH + 2:
+            if available < RTCM3_HEADER_LENGTH + 2:
                 break
             elif self.message_length is None:
-                self.header = rtcm3_header.parse(self.buffer)
+                self.header = rtcm3_header.parse(buffer[offset:offset + RTCM3_HEADER_LENGTH + 2])
                 self.logger.debug('Received RTCM %d message header. Waiting for payload. [payload_size=%d B]' %
                                   (self.header.message_id, self.header.info.payload_length))
                 self.message_length = RTCM3_HEADER_LENGTH + self.header.info.payload_length + RTCM3_CRC_LENGTH
 
             # Collect the payload and CRC.
-            if len(self.buffer) >= self.message_length:
+            if available >= self.message_length:
                 self.logger.debug('Message complete. Validating CRC.')
+                frame = buffer[offset:offset + self.message_length]
                 content_len = self.message_length - RTCM3_CRC_LENGTH
-                expected_crc = self.calculate_crc24q(self.buffer[:content_len])
-                received_crc = rtcm3_crc.parse(self.buffer[content_len:])
+                expected_crc = self.calculate_crc24q(frame[:content_len])
+                received_crc = rtcm3_crc.parse(frame[content_len:])
                 if expected_crc == received_crc:
                     self.logger.debug(
                         'CRC passed. Dispatching message. [message=%d, size=%d B, checksum=0x%06X]' %
                         (self.header.message_id, self.message_length, received_crc))
-                    self.logger.trace(''.join(['\\x%02X' % b for b in self.buffer[:self.message_length]]))
-                    message = rtcm3_frame.parse(self.buffer[:self.message_length])
+                    self.logger.trace(''.join(['\\x%02X' % b for b in frame]))
+                    message = rtcm3_frame.parse(frame)
                     if return_size or return_bytes or return_offset:
                         ret = {'message': message}
                         if return_size:
                             ret['size'] = self.message_length
                         if return_bytes:
-                            ret['bytes'] = self.buffer[:self.message_length]
+                            ret['bytes'] = frame
                         if return_offset:
                             ret['offset'] = self.total_data_offset
                         messages.append(ret)
@@ -288,14 +295,14 @@ class RTCMFramer(object):
                     if self.callback is not None:
                         self.callback(message)
                     # Message complete. Reset and search for the next preamble.
-                    self.buffer = self.buffer[self.message_length:]
+                    offset += self.message_length
                     self.total_data_offset += self.message_length
                 else:
                     self.logger.debug(
                         'CRC check failed, resyncing. [message=%d, size=%d B, crc=0x%62X, expected=0x%06X]' %
                         (self.header.message_id, self.message_length, received_crc, expected_crc))
-                    # Add all but first byte of failed message back onto data buffer to retry parsing.
-                    self.buffer = self.buffer[1:]
+                    # Skip the first byte of the failed message and retry parsing.
+                    offset += 1
                     self.total_data_offset += 1
 
                 self.header = None
@@ -304,6 +311,7 @@ class RTCMFramer(object):
             else:
                 break
 
+        self.buffer = buffer[offset:]
         return messages
 
     @classmethod
@@ -109,6 +109,17 @@ def test_bytes():
     framer.on_data(input)
     assert count[0] == 1
 
+    # Other bytes-like inputs should be handled the same way.
+    framer.reset()
+    count[0] = 0
+    framer.on_data(bytearray(input))
+    assert count[0] == 1
+
+    framer.reset()
+    count[0] = 0
+    framer.on_data(memoryview(input))
+    assert count[0] == 1
+
 
 def test_misaligned():
     message = [
@@ -300,3 +311,12 @@ def test_displayable_chars():
     results = framer.on_data(input)
     assert len(results) == 2
     assert count[0] == 2
+
+
+def test_calculate_checksum():
+    message = "$GPGGA,000000.000,3746.37327400,N,12224.26599800,W,2,13,2.1,3.260,M,34.210,M,11.1,0234*5B\r\n"
+
+    # The leading $ and everything from the * onward should be ignored, for both string and bytes input.
+    assert NMEAFramer._calculate_checksum(message) == 0x5B
+    assert NMEAFramer._calculate_checksum(message.encode()) == 0x5B
+    assert NMEAFramer._calculate_checksum(message[1:-5], is_stripped=True) == 0x5B
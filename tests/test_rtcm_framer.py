@@ -145,3 +145,19 @@ def test_lossless_resync():
     framer = RTCMFramer()
     results = framer.on_data(input)
     assert len(results) == 2
+
+
+def test_frame_split_input():
+    # Test framing with messages and garbage split arbitrarily across calls.
+    input = b'\xDE\xAD' + P1_RESET_MESSAGE + b'\xD3' + P1_RESPONSE_MESSAGE + b'\xBE\xEF'
+    framer = RTCMFramer()
+    results = []
+    for i in range(0, len(input), 5):
+        results += framer.on_data(input[i:i + 5], return_bytes=True, return_offset=True)
+    assert len(results) == 2
+    assert results[0]['bytes'] == P1_RESET_MESSAGE
+    assert results[0]['offset'] == 2
+    assert results[1]['bytes'] == P1_RESPONSE_MESSAGE
+    assert results[1]['offset'] == 2 + len(P1_RESET_MESSAGE) + 1
+    assert framer.buffer == b''
+    assert framer.total_data_offset == len(input)